@@ -3,44 +3,222 @@
 Improved workshop scraper with better debugging and extraction
 """
 import json
+import os
 import re
+import threading
+import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dateutil import parser as dateparser
 from dateutil import tz as datetz
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 import hashlib
 
+try:
+    import orjson  # optional: much faster JSON encode/decode, same output
+except ImportError:
+    orjson = None
+
 DEFAULT_TZ = "America/Los_Angeles"
+# Resolved once; the scrapers and the prune step all stamp dates in this zone
+DEFAULT_TZINFO = datetz.gettz(DEFAULT_TZ)
+# main() keeps events that started within this window and drops older ones
+PAST_EVENT_GRACE = timedelta(days=7)
+# Single switch for the BeautifulSoup tree builder used by every scraper:
+# lxml's C parser when installed, the pure-Python stdlib parser otherwise
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 DATE_WITH_OPTIONAL_YEAR_RE = re.compile(
     r'(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*,?\s+)?'
     r'(January|February|March|April|May|June|July|August|September|October|November|December)'
     r'\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{2,4}))?',
     re.IGNORECASE,
 )
+# Exact "Month D, YYYY" / "Mon. D, YYYY" strings (what the page date regexes hand to parse_date)
+MONTH_DAY_YEAR_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December'
+    r'|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sept?|Oct|Nov|Dec)\.?'
+    r'\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
+    re.IGNORECASE,
+)
+# "Month D, YYYY" anywhere in page text; case-sensitive so prose like "may" is skipped
+FULL_DATE_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}'
+)
+# Sound On titles lead with M.D.YY; ASCII classes are all the prefix needs
+SOUNDON_TITLE_DATE_RE = re.compile(r"\s*(\d{1,2})\.(\d{1,2})\.(\d{2,4})\s*[-–]", re.ASCII)
+# Only build the Shopify product payload script, not the whole product page
+PRODUCT_JSON_ID_RE = re.compile(r"^ProductJson-")
+PRODUCT_JSON_STRAINER = SoupStrainer("script", id=PRODUCT_JSON_ID_RE)
+# Index pages that are only mined for links
+ANCHOR_STRAINER = SoupStrainer("a")
+VAN_INDEX_STRAINER = SoupStrainer(["a", "link"])
+
+# Per-source title patterns, tried in order against the text around each date
+VTW_TITLE_RES = (
+    re.compile(r'Guest Instructor[:\s]+([A-Z][a-z]+ [A-Z][a-z]+)'),
+    re.compile(r'with\s+([A-Z][a-z]+ [A-Z][a-z]+)'),
+    re.compile(r'([A-Z][A-Z\s&]{10,60})'),
+)
+AIVA_TITLE_RES = (
+    re.compile(r'(?:Workshop|Class|Session)[:\s]+([A-Z][^.!?\n]{15,60})'),
+    re.compile(r'([A-Z][A-Z\s]{15,60})'),
+    re.compile(r'with\s+([A-Z][a-z]+ [A-Z][a-z]+)'),
+)
+# Footer/navigation text the AIVA title patterns can pick up instead of a class
+AIVA_NAV_WORDS = ("copyright", "reserved", "about", "contact", "home")
+HALP_TITLE_RE = re.compile(r'([A-Z][^.!?\n]{15,80})')
+# Real Voice's yearless fallback: "Nov 20", "Sept. 5th"
+SHORT_MONTH_DAY_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?', re.I)
+# TidyCal: event slugs in the page source, and "1.31 | INSTRUCTOR NAME | Topic" calendar rows
+REDSCYTHE_SLUG_RE = re.compile(r'/redscythestudio/([a-z0-9\-]+)')
+REDSCYTHE_ROW_RE = re.compile(r'(\d{1,2}\.\d{1,2})\s*\|\s*([^|]{5,60}?)\s*\|\s*([^\n|]{5,100})')
+
+# Sold-out markers in page text, and the badge suffix already on a title
+SOLD_OUT_RE = re.compile(r"\bsold[\s-]*out\b", re.IGNORECASE)
+SOLD_OUT_SUFFIX_RE = re.compile(r"\[\s*sold out\s*\]$", re.IGNORECASE)
+
+# Time patterns shared by extract_time (compiled once, used on every page)
+TIME_RANGE_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*[-–to]+\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)', re.I)
+COMPACT_TIME_RANGE_RE = re.compile(r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s*(am|pm)', re.I)
+SINGLE_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', re.I)
+
+# TidyCal detail pages always print minutes ("9:00 am - 1:00 pm")
+DETAIL_TIME_RANGE_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)\s*[-–]\s*(\d{1,2}):(\d{2})\s*(am|pm)', re.I)
+DETAIL_SINGLE_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)', re.I)
+DURATION_RE = re.compile(r'(\d+)\s*(?:hour|hr)', re.I)
+
+# One keep-alive session so repeat hits on the same host skip the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Encoding": "gzip, deflate",
+})
+# Pool enough connections per host for the concurrent scrapers; retry dropped
+# connections and transient gateway errors before giving up on a page
+_retry = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    # Retry-After is unbounded and would be slept while holding the host slot
+    respect_retry_after_header=False,
+    raise_on_status=False,  # hand the last response back so fetch() logs its status
+)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Per-thread buffer so pooled scrapers don't interleave their progress lines
+_output = threading.local()
+
+def say(msg):
+    """Print a progress line, or buffer it while running inside run_scraper."""
+    lines = getattr(_output, "lines", None)
+    if lines is None:
+        print(msg)
+    else:
+        lines.append(msg)
 
 def log(msg):
-    print(f"  {msg}")
+    say(f"  {msg}")
+
+# Politeness limits per host, shared by every scraper and fetch_many() pool
+HOST_MAX_CONCURRENCY = 4
+HOST_MIN_INTERVAL = 0.2  # seconds between request starts to the same host
+_host_lock = threading.Lock()
+_host_slots = {}  # Maps host to a Semaphore of HOST_MAX_CONCURRENCY
+_host_next_start = {}  # Maps host to the earliest monotonic time of its next request
+
+def _host_slot(host):
+    with _host_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.Semaphore(HOST_MAX_CONCURRENCY)
+        return slot
+
+def _wait_for_host(host):
+    """Sleep until this host's next request start is due, and book the one after."""
+    with _host_lock:
+        now = time.monotonic()
+        start = max(now, _host_next_start.get(host, 0.0))
+        _host_next_start[host] = start + HOST_MIN_INTERVAL
+    if start > now:
+        time.sleep(start - now)
 
 def fetch(url, headers=None):
     """Fetch HTML with better error handling"""
+    host = urlparse(url).netloc
     try:
-        default_headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        if headers:
-            default_headers.update(headers)
-        
-        r = requests.get(url, timeout=30, headers=default_headers)
+        with _host_slot(host):
+            _wait_for_host(host)
+            # Per-call headers are merged over the session defaults
+            r = SESSION.get(url, timeout=30, headers=headers)
         r.raise_for_status()
         return r.text
     except Exception as e:
         log(f"⚠️  Failed to fetch {url}: {e}")
         return None
 
+# Per-source settings (e.g. max_event_pages); the workflow points this at the repo's config
+SOURCES_JSON_PATH = os.environ.get("SOURCES_JSON_PATH", "config/workshop_sources.json")
+
+@lru_cache(maxsize=None)
+def source_config(source_id):
+    """Settings for one source from the sources config, or {} when it's unavailable."""
+    try:
+        with open(SOURCES_JSON_PATH, "rb") as f:
+            sources = loads_json(f.read()).get("sources", [])
+    except (OSError, ValueError, AttributeError) as e:
+        log(f"⚠️  Could not read {SOURCES_JSON_PATH}, using built-in limits: {e}")
+        return {}
+    for source in sources:
+        if source.get("id") == source_id:
+            return source
+    return {}
+
+def _fetch_buffered(url):
+    """fetch() in a pool thread, returning (html, the lines it logged)."""
+    _output.lines = []
+    try:
+        return fetch(url), _output.lines
+    finally:
+        _output.lines = None
+
+def fetch_many(urls, max_workers=8):
+    """Fetch several pages concurrently; yields their HTML (or None) in input order."""
+    # All URLs in a call share one host, and fetch() lets only HOST_MAX_CONCURRENCY through
+    workers = min(max_workers, HOST_MAX_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Walk results lazily so the caller parses each page while later ones download
+        for html, lines in pool.map(_fetch_buffered, urls):
+            # Replay fetch errors into the calling scraper's output
+            for line in lines:
+                say(line)
+            yield html
+
+@lru_cache(maxsize=4096)
 def parse_date(text, tz=DEFAULT_TZ):
-    """Parse any date format"""
+    """Parse any date format (memoized; the same date strings recur across pages)"""
+    # Fast path: build "January 5, 2026" / "Jan. 5, 2026" directly instead of running dateutil
+    match = MONTH_DAY_YEAR_RE.fullmatch(text.strip()) if text else None
+    if match:
+        month_name, day_text, year_text = match.groups()
+        month = datetime.strptime(month_name[:3], "%b").month
+        try:
+            return datetime(int(year_text), month, int(day_text), tzinfo=datetz.gettz(tz))
+        except ValueError:
+            return None
+
     try:
         d = dateparser.parse(text, fuzzy=True)
         if d and d.tzinfo is None:
@@ -54,83 +232,72 @@ def make_id(source, title, url):
     # CRITICAL FIX: Include title to prevent collisions when multiple events
     # share the same registration URL (e.g., Red Scythe, HALP, etc.)
     key = f"{source}|{title}|{url}"
-    hash_val = hashlib.sha1(key.encode()).hexdigest()[:12]
+    # Not a security use; keeps SHA-1 so existing IDs in resources.json stay put
+    hash_val = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:12]
     return f"{source}-{hash_val}"
 
+def is_pruned_day(day, now):
+    """True when any start time on this calendar day would be dropped by main()'s prune."""
+    return day + timedelta(days=1) <= now - PAST_EVENT_GRACE
+
+def to_24h(hour, period):
+    """Convert a 12-hour clock hour and its am/pm marker to a 24-hour hour."""
+    period = period.lower()
+    if period == 'pm' and hour < 12:
+        return hour + 12
+    if period == 'am' and hour == 12:
+        return 0
+    return hour
+
+
 def extract_time(text):
     """Extract time from text - IMPROVED VERSION"""
-    # Try range first: 7pm-9pm, 7:00pm-9:00pm, 7-9pm
-    patterns = [
-        # Full range: 7:00pm-9:00pm
-        r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*[-–to]+\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)',
-        # Compact range: 7-9pm
-        r'(\d{1,2})\s*[-–]\s*(\d{1,2})\s*(am|pm)',
-    ]
-    
-    for pattern in patterns:
-        m = re.search(pattern, text, re.I)
+    # Every pattern below contains an "7pm"-style time, so one scan for the
+    # first such time rules out pages with none and is reused as the fallback
+    single = SINGLE_TIME_RE.search(text)
+    if not single:
+        return None
+
+    # Try range first: full (7:00pm-9:00pm), then compact (7-9pm).
+    # A full range starts with a single time, so it can't start before one.
+    for pattern, pos in ((TIME_RANGE_RE, single.start()), (COMPACT_TIME_RANGE_RE, 0)):
+        m = pattern.search(text, pos)
         if m:
             groups = m.groups()
             
             # Handle compact format (7-9pm)
             if len(groups) == 3:
-                sh = int(groups[0])
+                # Both times get same AM/PM
+                sh = to_24h(int(groups[0]), groups[2])
                 sm = 0
-                eh = int(groups[1])
+                eh = to_24h(int(groups[1]), groups[2])
                 em = 0
-                period = groups[2].lower()
-                
-                # Both times get same AM/PM
-                if period == 'pm' and sh < 12:
-                    sh += 12
-                if period == 'pm' and eh < 12:
-                    eh += 12
-                elif period == 'am' and sh == 12:
-                    sh = 0
-                elif period == 'am' and eh == 12:
-                    eh = 0
             else:
                 # Full format
-                sh = int(groups[0])
+                sh = to_24h(int(groups[0]), groups[2])
                 sm = int(groups[1] or 0)
-                if groups[2].lower() == 'pm' and sh < 12:
-                    sh += 12
-                elif groups[2].lower() == 'am' and sh == 12:
-                    sh = 0
-                
-                eh = int(groups[3])
+                eh = to_24h(int(groups[3]), groups[5])
                 em = int(groups[4] or 0)
-                if groups[5].lower() == 'pm' and eh < 12:
-                    eh += 12
-                elif groups[5].lower() == 'am' and eh == 12:
-                    eh = 0
             
             # Validate hours
             if 0 <= sh <= 23 and 0 <= eh <= 23:
                 return sh, sm, eh, em
     
-    # Try single time: 7pm, 7:00pm
-    m = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', text, re.I)
-    if m:
-        sh = int(m.group(1))
-        sm = int(m.group(2) or 0)
-        if m.group(3).lower() == 'pm' and sh < 12:
-            sh += 12
-        elif m.group(3).lower() == 'am' and sh == 12:
-            sh = 0
-        
-        # Validate hour
-        if 0 <= sh <= 23:
-            return sh, sm, sh + 2, sm  # Default 2hr duration
+    # Fall back to the single time: 7pm, 7:00pm
+    sh = to_24h(int(single.group(1)), single.group(3))
+    sm = int(single.group(2) or 0)
+    
+    # Validate hour
+    if 0 <= sh <= 23:
+        return sh, sm, sh + 2, sm  # Default 2hr duration
     
     return None
 
 
 def detect_sold_out(*texts):
     """Return True when a source page explicitly marks a class as sold out."""
-    pattern = re.compile(r"\bsold[\s-]*out\b", re.IGNORECASE)
     for text in texts:
-        if text and pattern.search(text):
+        if text and SOLD_OUT_RE.search(text):
             return True
     return False
 
@@ -167,13 +334,18 @@ def extract_upcoming_date(text, tz=DEFAULT_TZ, reference=None):
     return None
 
 
-def extract_shopify_product_json(html):
-    """Pull the primary Shopify product payload from a product detail page."""
-    if not html:
+def extract_shopify_product_json(html, soup=None):
+    """Pull the primary Shopify product payload from a product detail page.
+
+    Pass the page's existing soup to reuse it instead of parsing again.
+    """
+    # Skip the parse entirely on pages that never embed the payload
+    if not html or "ProductJson-" not in html:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
-    script = soup.find("script", id=re.compile(r"^ProductJson-"))
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=PRODUCT_JSON_STRAINER)
+    script = soup.find("script", id=PRODUCT_JSON_ID_RE)
     if not script:
         return None
 
@@ -182,7 +354,7 @@ def extract_shopify_product_json(html):
         return None
 
     try:
-        return json.loads(raw)
+        return loads_json(str(raw))  # orjson rejects bs4's str subclasses
     except json.JSONDecodeError:
         return None
 
@@ -211,7 +383,7 @@ def apply_status_badge(event, sold_out=False):
 
     updated = dict(event)
     title = updated.get("title", "")
-    if title and not re.search(r"\[\s*sold out\s*\]$", title, re.IGNORECASE):
+    if title and not SOLD_OUT_SUFFIX_RE.search(title):
         updated["title"] = f"{title} [SOLD OUT]"
 
     updated["soldOut"] = True
@@ -222,7 +394,11 @@ def apply_status_badge(event, sold_out=False):
 # ============================================================================
 # VOICE ACTORS NETWORK - FIXED TIME PARSING
 # ============================================================================
-def collect_van_product_links(base_url="https://voiceactorsnetwork.com/collections/all", max_pages=12):
+# Storefront items that are never workshops, matched against page text and product handles
+VAN_NON_WORKSHOP_WORDS = ("gift card", "donation", "membership", "t-shirt", "merch")
+VAN_NON_WORKSHOP_TITLES = ("audit a clinic", "wait list spot")
+
+def collect_van_product_links(base_url="https://voiceactorsnetwork.com/collections/all", max_pages=12, max_links=None):
     """Follow VAN collection pagination so classes are not missed alphabetically."""
     links = []
     seen_links = set()
@@ -230,14 +406,15 @@ def collect_van_product_links(base_url="https://voiceactorsnetwork.com/collectio
     page_url = base_url
     page_count = 0
 
-    while page_url and page_url not in seen_pages and page_count < max_pages:
+    while page_url and page_url not in seen_pages and page_count < max_pages and (max_links is None or len(links) < max_links):
         html = fetch(page_url)
         if not html:
             break
 
         page_count += 1
         seen_pages.add(page_url)
-        soup = BeautifulSoup(html, "html.parser")
+        # Product anchors and the rel=next pagination link are all this page is used for
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=VAN_INDEX_STRAINER)
 
         page_links = 0
         for a in soup.find_all("a", href=True):
@@ -253,9 +430,17 @@ def collect_van_product_links(base_url="https://voiceactorsnetwork.com/collectio
             if url in seen_links:
                 continue
 
+            # Drop obvious non-workshops first so they don't count toward max_links
+            handle_words = handle.replace("-", " ")
+            if any(x.replace("-", " ") in handle_words for x in VAN_NON_WORKSHOP_WORDS + VAN_NON_WORKSHOP_TITLES):
+                continue
+
             seen_links.add(url)
             links.append(url)
             page_links += 1
+            if max_links is not None and len(links) >= max_links:
+                log(f"Reached the {max_links} product page limit")
+                break
 
         log(f"Page {page_count}: found {page_links} product pages")
 
@@ -268,27 +453,32 @@ def collect_van_product_links(base_url="https://voiceactorsnetwork.com/collectio
 
 def scrape_van():
     """Voice Actors Network - with better error handling"""
-    print("[VAN] Scraping Voice Actors Network...")
+    say("[VAN] Scraping Voice Actors Network...")
     events = []
 
-    links = collect_van_product_links()
+    links = collect_van_product_links(max_links=source_config("voiceactorsnetwork").get("max_event_pages", 120))
     if not links:
         return events
 
-    for url in links:
+    # One reference time for year inference across every product page
+    now = datetime.now(DEFAULT_TZINFO)
+    for url, html in zip(links, fetch_many(links)):
         try:
-            html = fetch(url)
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             text = soup.get_text(" ", strip=True)
-            product_data = extract_shopify_product_json(html)
+            product_data = extract_shopify_product_json(html, soup)
             product_description = ""
             if product_data:
                 product_description = product_data.get("content") or product_data.get("description") or ""
 
-            product_text = re.sub(r"\s+", " ", BeautifulSoup(product_description, "html.parser").get_text(" ", strip=True))
+            # Plain-text descriptions (no tags or entities) don't need a parser
+            if "<" in product_description or "&" in product_description:
+                product_text = clean_text(BeautifulSoup(product_description, HTML_PARSER).get_text(" ", strip=True))
+            else:
+                product_text = clean_text(product_description)
 
             # Skip non-workshops
             title = ""
@@ -303,15 +493,15 @@ def scrape_van():
             lower_title = title.lower()
             lower_text = f"{lower_title} {product_text.lower()} {text.lower()}"
 
-            if any(x in lower_text for x in ["gift card", "donation", "membership", "t-shirt", "merch"]):
+            if any(x in lower_text for x in VAN_NON_WORKSHOP_WORDS):
                 continue
 
-            if any(x in lower_title for x in ["audit a clinic", "wait list spot"]):
+            if any(x in lower_title for x in VAN_NON_WORKSHOP_TITLES):
                 continue
 
-            date = extract_upcoming_date(" ".join([title, product_text]))
+            date = extract_upcoming_date(" ".join([title, product_text]), reference=now)
             if not date:
-                date = extract_upcoming_date(text)
+                date = extract_upcoming_date(text, reference=now)
             if not date:
                 continue
 
@@ -354,7 +544,7 @@ def scrape_van():
             log(f"⚠️  Error on {url.split('/')[-1]}: {e}")
             continue
 
-    print(f"[VAN] Found {len(events)} events")
+    say(f"[VAN] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -362,19 +552,21 @@ def scrape_van():
 # ============================================================================
 def scrape_voicetrax():
     """Voice Trax West - look harder for dates"""
-    print("[VOICE TRAX WEST] Scraping...")
+    say("[VOICE TRAX WEST] Scraping...")
     events = []
     
     html = fetch("https://www.voicetraxwest.com/guest-instructors")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text()
     
     # First, try to find dates on the main page
     log("Checking main page for upcoming classes...")
-    date_matches = re.finditer(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text)
+    date_matches = FULL_DATE_RE.finditer(text)
+    # A sold-out marker anywhere on the page applies to every date on it; check once
+    page_sold_out = detect_sold_out(text)
     
     for match in date_matches:
         try:
@@ -387,15 +579,9 @@ def scrape_voicetrax():
             nearby = text[max(0, pos-300):min(len(text), pos+200)]
             
             # Look for instructor name or class title
-            title_patterns = [
-                r'Guest Instructor[:\s]+([A-Z][a-z]+ [A-Z][a-z]+)',
-                r'with\s+([A-Z][a-z]+ [A-Z][a-z]+)',
-                r'([A-Z][A-Z\s&]{10,60})'
-            ]
-            
             title = None
-            for pattern in title_patterns:
-                title_match = re.search(pattern, nearby)
+            for pattern in VTW_TITLE_RES:
+                title_match = pattern.search(nearby)
                 if title_match:
                     title = title_match.group(1).strip()
                     break
@@ -422,7 +608,7 @@ def scrape_voicetrax():
                 "endAt": end.isoformat(),
                 "registrationURL": "https://www.voicetraxwest.com/guest-instructors"
             }
-            event = apply_status_badge(event, detect_sold_out(nearby, text))
+            event = apply_status_badge(event, page_sold_out or detect_sold_out(nearby))
             events.append(event)
             log(f"✓ {event['title'][:50]}")
             
@@ -430,7 +616,7 @@ def scrape_voicetrax():
             log(f"⚠️  Error: {e}")
             continue
     
-    print(f"[VOICE TRAX WEST] Found {len(events)} events")
+    say(f"[VOICE TRAX WEST] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -438,12 +624,13 @@ def scrape_voicetrax():
 # ============================================================================
 def clean_text(text):
     """Collapse whitespace so scraped titles/descriptions are stable."""
-    return re.sub(r"\s+", " ", text or "").strip()
+    # str.split() breaks on exactly the characters \s matches, without the regex engine
+    return " ".join((text or "").split())
 
 
 def parse_soundon_title_date(title, tz=DEFAULT_TZ):
     """Sound On titles start with M.D.YY - use that as the canonical date."""
-    match = re.match(r"\s*(\d{1,2})\.(\d{1,2})\.(\d{2,4})\s*[-–]", clean_text(title))
+    match = SOUNDON_TITLE_DATE_RE.match(clean_text(title))
     if not match:
         return None
 
@@ -461,7 +648,7 @@ def parse_soundon_title_date(title, tz=DEFAULT_TZ):
 
 def extract_soundon_detail_info(html):
     """Use the Squarespace product detail page to recover time and venue."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     candidate_texts = []
 
     for attrs in (
@@ -491,7 +678,7 @@ def extract_soundon_detail_info(html):
 
 def scrape_soundon():
     """Sound On Studio - parse Squarespace product cards and detail pages"""
-    print("[SOUND ON STUDIO] Scraping...")
+    say("[SOUND ON STUDIO] Scraping...")
     events = []
     
     base_url = "https://www.soundonstudio.com/classsignup"
@@ -499,10 +686,13 @@ def scrape_soundon():
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     cards = soup.select("div.product-list-item")
     log(f"Found {len(cards)} product cards")
 
+    now = datetime.now(DEFAULT_TZINFO)
+    # Pick the cards worth a detail-page fetch first, then fetch those together
+    listings = []  # (card, title, date, detail_url)
     for card in cards:
         try:
             link = card.select_one("a.product-list-item-link[href]")
@@ -515,13 +705,22 @@ def scrape_soundon():
             if not date:
                 log(f"Skipping product with unparseable date: {title[:50]}")
                 continue
+            if is_pruned_day(date, now):
+                # Would be pruned anyway; don't spend a detail-page fetch on it
+                continue
+
+            listings.append((card, title, date, urljoin(base_url, link["href"])))
+        except Exception as e:
+            log(f"⚠️  Error: {e}")
+            continue
 
-            detail_url = urljoin(base_url, link["href"])
+    detail_pages = fetch_many([detail_url for _, _, _, detail_url in listings])
+    for (card, title, date, detail_url), detail_html in zip(listings, detail_pages):
+        try:
             sold_out = "sold-out" in (card.get("class") or [])
 
             time_info = None
             venue = "See listing"
-            detail_html = fetch(detail_url)
             if detail_html:
                 time_info, venue = extract_soundon_detail_info(detail_html)
 
@@ -555,7 +754,7 @@ def scrape_soundon():
             log(f"⚠️  Error: {e}")
             continue
     
-    print(f"[SOUND ON STUDIO] Found {len(events)} events")
+    say(f"[SOUND ON STUDIO] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -563,23 +762,25 @@ def scrape_soundon():
 # ============================================================================
 def scrape_halp():
     """HALP Academy - better link detection"""
-    print("[HALP ACADEMY] Scraping...")
+    say("[HALP ACADEMY] Scraping...")
     events = []
     
     html = fetch("https://halpacademy.com/events/search/")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     
     # Find event links - be more specific
     links = []
+    seen_links = set()
     for a in soup.find_all("a", href=True):
         href = a["href"]
         # Look for actual event slugs, not just /events/
         if "/events/" in href and href != "/events/" and href != "/events/search/":
             url = urljoin("https://halpacademy.com", href)
-            if url not in links:
+            if url not in seen_links:
+                seen_links.add(url)
                 links.append(url)
     
     log(f"Found {len(links)} event links")
@@ -588,9 +789,10 @@ def scrape_halp():
     if len(links) == 0:
         log("No event links found, checking main events page...")
         text = soup.get_text()
+        page_sold_out = detect_sold_out(text)
         
         # Look for dates on the search page itself
-        for match in re.finditer(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text):
+        for match in FULL_DATE_RE.finditer(text):
             try:
                 date = parse_date(match.group(0))
                 if not date:
@@ -599,7 +801,7 @@ def scrape_halp():
                 pos = match.start()
                 nearby = text[max(0, pos-200):min(len(text), pos+200)]
                 
-                title_match = re.search(r'([A-Z][^.!?\n]{15,80})', nearby)
+                title_match = HALP_TITLE_RE.search(nearby)
                 title = title_match.group(1).strip() if title_match else "Event"
                 
                 time_info = extract_time(nearby)
@@ -620,26 +822,26 @@ def scrape_halp():
                     "endAt": end.isoformat(),
                     "registrationURL": "https://halpacademy.com/events/search/"
                 }
-                event = apply_status_badge(event, detect_sold_out(nearby, text))
+                event = apply_status_badge(event, page_sold_out or detect_sold_out(nearby))
                 events.append(event)
                 log(f"✓ {event['title'][:50]}")
             except Exception as e:
                 continue
     
     # Process individual event pages
-    for url in links[:20]:
+    pages = links[:source_config("halp_academy").get("max_event_pages", 20)]
+    for url, html in zip(pages, fetch_many(pages)):
         try:
-            html = fetch(url)
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             text = soup.get_text()
             
             title_tag = soup.find("h1")
             title = title_tag.get_text(strip=True) if title_tag else "Event"
             
-            date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text)
+            date_match = FULL_DATE_RE.search(text)
             if not date_match:
                 continue
             
@@ -673,7 +875,7 @@ def scrape_halp():
             log(f"⚠️  Error on {url}: {e}")
             continue
     
-    print(f"[HALP ACADEMY] Found {len(events)} events")
+    say(f"[HALP ACADEMY] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -681,24 +883,26 @@ def scrape_halp():
 # ============================================================================
 def scrape_aiva():
     """Adventures in Voice Acting - better detection"""
-    print("[AIVA] Scraping...")
+    say("[AIVA] Scraping...")
     events = []
     
     html = fetch("https://www.adventuresinvoiceacting.com/")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text()
     
     log("Searching for upcoming events...")
     
     # Look for dates
-    date_matches = list(re.finditer(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text))
+    date_matches = list(FULL_DATE_RE.finditer(text))
     
     if date_matches:
         log(f"Found {len(date_matches)} potential dates")
     
+    now = datetime.now(DEFAULT_TZINFO)
+    page_sold_out = detect_sold_out(text)
     for match in date_matches:
         try:
             date = parse_date(match.group(0))
@@ -706,7 +910,6 @@ def scrape_aiva():
                 continue
             
             # Check if it's in the future
-            now = datetime.now(datetz.gettz(DEFAULT_TZ))
             if date < now - timedelta(days=30):
                 continue
             
@@ -714,19 +917,13 @@ def scrape_aiva():
             nearby = text[max(0, pos-250):min(len(text), pos+150)]
             
             # Look for workshop/class title
-            title_patterns = [
-                r'(?:Workshop|Class|Session)[:\s]+([A-Z][^.!?\n]{15,60})',
-                r'([A-Z][A-Z\s]{15,60})',
-                r'with\s+([A-Z][a-z]+ [A-Z][a-z]+)'
-            ]
-            
             title = None
-            for pattern in title_patterns:
-                title_match = re.search(pattern, nearby)
+            for pattern in AIVA_TITLE_RES:
+                title_match = pattern.search(nearby)
                 if title_match:
                     title = title_match.group(1).strip()
                     # Skip if it looks like navigation
-                    if any(x in title.lower() for x in ["copyright", "reserved", "about", "contact", "home"]):
+                    if any(x in title.lower() for x in AIVA_NAV_WORDS):
                         title = None
                         continue
                     break
@@ -752,7 +949,7 @@ def scrape_aiva():
                 "endAt": end.isoformat(),
                 "registrationURL": "https://www.adventuresinvoiceacting.com/"
             }
-            event = apply_status_badge(event, detect_sold_out(nearby, text))
+            event = apply_status_badge(event, page_sold_out or detect_sold_out(nearby))
             events.append(event)
             log(f"✓ {event['title'][:50]}")
             
@@ -760,7 +957,7 @@ def scrape_aiva():
             log(f"⚠️  Error: {e}")
             continue
     
-    print(f"[AIVA] Found {len(events)} events")
+    say(f"[AIVA] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -768,32 +965,34 @@ def scrape_aiva():
 # ============================================================================
 def scrape_vopros():
     """The VO Pros - works well, keep it"""
-    print("[VO PROS] Scraping The VO Pros...")
+    say("[VO PROS] Scraping The VO Pros...")
     events = []
     
     html = fetch("https://www.thevopros.com/shop/")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ANCHOR_STRAINER)
     
     # Find event links
     links = []
+    seen_links = set()
     for a in soup.find_all("a", href=True):
         if "/events/" in a["href"] and not a["href"].endswith("/events/"):
             url = urljoin("https://www.thevopros.com", a["href"])
-            if url not in links:
+            if url not in seen_links:
+                seen_links.add(url)
                 links.append(url)
     
     log(f"Found {len(links)} event pages")
     
-    for url in links[:25]:
+    pages = links[:source_config("thevopros").get("max_event_pages", 25)]
+    for url, html in zip(pages, fetch_many(pages)):
         try:
-            html = fetch(url)
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             text = soup.get_text()
             
             # Get title - try multiple methods
@@ -808,7 +1007,7 @@ def scrape_vopros():
                 title = slug.replace("-", " ").title()
             
             # Find date
-            date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text)
+            date_match = FULL_DATE_RE.search(text)
             if not date_match:
                 continue
             
@@ -843,7 +1042,7 @@ def scrape_vopros():
             log(f"⚠️  Error on {url}: {e}")
             continue
     
-    print(f"[VO PROS] Found {len(events)} events")
+    say(f"[VO PROS] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -851,32 +1050,35 @@ def scrape_vopros():
 # ============================================================================
 def scrape_realvoice():
     """Real Voice LA - works well"""
-    print("[REAL VOICE LA] Scraping...")
+    say("[REAL VOICE LA] Scraping...")
     events = []
     
     html = fetch("https://www.realvoicela.com/classes")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ANCHOR_STRAINER)
     
     # Find service links
     links = []
+    seen_links = set()
     for a in soup.find_all("a", href=True):
         if "service-page" in a["href"] or "book-online" in a["href"]:
             url = urljoin("https://www.realvoicela.com", a["href"])
-            if url not in links:
+            if url not in seen_links:
+                seen_links.add(url)
                 links.append(url)
     
     log(f"Found {len(links)} class pages")
     
-    for url in links[:30]:
+    now = datetime.now(DEFAULT_TZINFO)
+    pages = links[:source_config("realvoicela").get("max_event_pages", 30)]
+    for url, html in zip(pages, fetch_many(pages)):
         try:
-            html = fetch(url)
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             text = soup.get_text()
             
             # Get title
@@ -890,19 +1092,21 @@ def scrape_realvoice():
             
             # Find date
             date = None
-            date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text)
+            date_match = FULL_DATE_RE.search(text)
             if date_match:
                 date = parse_date(date_match.group(0))
             
             if not date:
-                date_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?', text, re.I)
+                date_match = SHORT_MONTH_DAY_RE.search(text)
                 if date_match:
-                    now = datetime.now(datetz.gettz(DEFAULT_TZ))
-                    date_text = date_match.group(0) + f", {now.year}"
-                    date = parse_date(date_text)
+                    date = parse_date(date_match.group(0) + f", {now.year}")
                     if date and date < now - timedelta(days=30):
-                        date_text = date_match.group(0) + f", {now.year + 1}"
-                        date = parse_date(date_text)
+                        # Same month/day next year, without a second parse;
+                        # Feb 29 has no next-year equivalent
+                        try:
+                            date = date.replace(year=date.year + 1)
+                        except ValueError:
+                            date = None
             
             if not date:
                 log(f"No date found for: {title[:40]}")
@@ -935,7 +1139,7 @@ def scrape_realvoice():
             log(f"⚠️  Error on {url}: {e}")
             continue
     
-    print(f"[REAL VOICE LA] Found {len(events)} events")
+    say(f"[REAL VOICE LA] Found {len(events)} events")
     return events
 
 # ============================================================================
@@ -943,7 +1147,7 @@ def scrape_realvoice():
 # ============================================================================
 def scrape_redscythe():
     """Red Scythe Studio - TidyCal with detail page time extraction"""
-    print("[RED SCYTHE] Scraping...")
+    say("[RED SCYTHE] Scraping...")
     events = []
     
     # Step 1: Fetch main calendar page
@@ -951,7 +1155,7 @@ def scrape_redscythe():
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text()
     
     # Step 2: Extract all event slugs/URLs from page source
@@ -959,7 +1163,7 @@ def scrape_redscythe():
     event_slugs = {}  # Maps slug to full URL
     
     # Look for patterns like: /redscythestudio/event-slug
-    for match in re.finditer(r'/redscythestudio/([a-z0-9\-]+)', html):
+    for match in REDSCYTHE_SLUG_RE.finditer(html):
         slug = match.group(1)
         # Skip generic pages
         if slug in ['booking', 'calendar', 'settings', 'about']:
@@ -970,10 +1174,8 @@ def scrape_redscythe():
     
     # Step 3: Parse calendar text for event info
     # TidyCal format: "1.31 | INSTRUCTOR NAME | Topic"
-    pattern = r'(\d{1,2}\.\d{1,2})\s*\|\s*([^|]{5,60}?)\s*\|\s*([^\n|]{5,100})'
-    
     calendar_events = []
-    for match in re.finditer(pattern, text):
+    for match in REDSCYTHE_ROW_RE.finditer(text):
         date_str = match.group(1)  # "2.7"
         instructor = match.group(2).strip()  # "BRITTANY COX"
         topic = match.group(3).strip()  # "strong reads that book the room"
@@ -991,7 +1193,12 @@ def scrape_redscythe():
     
     log(f"Found {len(calendar_events)} workshops on calendar")
     
-    # Step 4: Process each event
+    # Step 4: Work out each event's date and detail page
+    tzinfo = DEFAULT_TZINFO
+    now = datetime.now(tzinfo)
+    rows = []  # (idx, instructor, topic, date_str, date, detail_url, first row for that URL)
+    detail_urls = []  # Unique detail URLs, in first-seen order
+    seen_urls = set()
     for idx, event_info in enumerate(calendar_events, 1):
         try:
             instructor = event_info['instructor']
@@ -1000,13 +1207,14 @@ def scrape_redscythe():
             
             # Parse date (M.D format)
             month, day = map(int, date_str.split('.'))
-            now = datetime.now(datetz.gettz(DEFAULT_TZ))
             year = now.year
-            date = datetime(year, month, day, tzinfo=datetz.gettz(DEFAULT_TZ))
+            date = datetime(year, month, day, tzinfo=tzinfo)
             
             # If date is in past, assume next year
             if date < now - timedelta(days=30):
-                date = datetime(year + 1, month, day, tzinfo=datetz.gettz(DEFAULT_TZ))
+                date = datetime(year + 1, month, day, tzinfo=tzinfo)
+            if is_pruned_day(date, now):
+                continue
             
             # Step 5: Try to find matching detail URL
             detail_url = None
@@ -1018,17 +1226,34 @@ def scrape_redscythe():
                     detail_url = url
                     break
             
-            # Step 6: Attempt to fetch time from detail page
+            first = bool(detail_url) and detail_url not in seen_urls
+            if first:
+                seen_urls.add(detail_url)
+                detail_urls.append(detail_url)
+                log(f"[{idx}/{len(calendar_events)}] Fetching {detail_url.split('/')[-1][:30]}...")
+            rows.append((idx, instructor, topic, date_str, date, detail_url, first))
+        except Exception as e:
+            log(f"⚠️  Error parsing event {idx}: {e}")
+            continue
+    
+    # Step 6: Fetch each distinct detail page once, concurrently, and pull its time
+    detail_pages = {}  # Maps detail URL to (html, extracted time); successful fetches only
+    for url, detail_html in zip(detail_urls, fetch_many(detail_urls)):
+        if detail_html:
+            detail_pages[url] = (detail_html, extract_time_from_detail_page(detail_html))
+    
+    for idx, instructor, topic, date_str, date, detail_url, first in rows:
+        try:
             actual_time = None
             if detail_url:
-                log(f"[{idx}/{len(calendar_events)}] Fetching {detail_url.split('/')[-1][:30]}...")
-                
-                import time as time_module
-                time_module.sleep(0.5)  # Be polite
+                if detail_url not in detail_pages and not first:
+                    # Retry a page that failed earlier, so one transient error doesn't
+                    # put the default time on every row for this instructor
+                    detail_html = fetch(detail_url)
+                    if detail_html:
+                        detail_pages[detail_url] = (detail_html, extract_time_from_detail_page(detail_html))
                 
-                detail_html = fetch(detail_url)
-                if detail_html:
-                    actual_time = extract_time_from_detail_page(detail_html)
+                detail_html, actual_time = detail_pages.get(detail_url, (None, None))
             
             # Step 7: Set time (actual or smart default)
             if actual_time:
@@ -1061,7 +1286,7 @@ def scrape_redscythe():
             log(f"⚠️  Error parsing event {idx}: {e}")
             continue
     
-    print(f"[RED SCYTHE] Found {len(events)} events")
+    say(f"[RED SCYTHE] Found {len(events)} events")
     return events
 
 
@@ -1076,58 +1301,31 @@ def extract_time_from_detail_page(html):
     if not html:
         return None
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text()
     
     # Pattern 1: Time range (9:00 am - 1:00 pm)
-    time_range = re.search(
-        r'(\d{1,2}):(\d{2})\s*(am|pm)\s*[-–]\s*(\d{1,2}):(\d{2})\s*(am|pm)',
-        text,
-        re.IGNORECASE
-    )
+    time_range = DETAIL_TIME_RANGE_RE.search(text)
     
     if time_range:
-        sh = int(time_range.group(1))
+        # Convert to 24h
+        sh = to_24h(int(time_range.group(1)), time_range.group(3))
         sm = int(time_range.group(2))
-        s_period = time_range.group(3).lower()
-        
-        eh = int(time_range.group(4))
+        eh = to_24h(int(time_range.group(4)), time_range.group(6))
         em = int(time_range.group(5))
-        e_period = time_range.group(6).lower()
-        
-        # Convert to 24h
-        if s_period == 'pm' and sh < 12:
-            sh += 12
-        elif s_period == 'am' and sh == 12:
-            sh = 0
-            
-        if e_period == 'pm' and eh < 12:
-            eh += 12
-        elif e_period == 'am' and eh == 12:
-            eh = 0
         
         return sh, sm, eh, em
     
     # Pattern 2: Single time with duration
-    single_time = re.search(
-        r'(\d{1,2}):(\d{2})\s*(am|pm)',
-        text,
-        re.IGNORECASE
-    )
+    single_time = DETAIL_SINGLE_TIME_RE.search(text)
     
     if single_time:
-        sh = int(single_time.group(1))
-        sm = int(single_time.group(2))
-        period = single_time.group(3).lower()
-        
         # Convert to 24h
-        if period == 'pm' and sh < 12:
-            sh += 12
-        elif period == 'am' and sh == 12:
-            sh = 0
+        sh = to_24h(int(single_time.group(1)), single_time.group(3))
+        sm = int(single_time.group(2))
         
         # Look for duration
-        duration_match = re.search(r'(\d+)\s*(?:hour|hr)', text, re.IGNORECASE)
+        duration_match = DURATION_RE.search(text)
         if duration_match:
             duration_hours = int(duration_match.group(1))
         else:
@@ -1148,32 +1346,34 @@ def extract_time_from_detail_page(html):
 # ============================================================================
 def scrape_vodojo():
     """The VO Dojo"""
-    print("[VO DOJO] Scraping...")
+    say("[VO DOJO] Scraping...")
     events = []
     
     html = fetch("https://www.thevodojo.com/upcoming-events-nav")
     if not html:
         return events
     
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ANCHOR_STRAINER)
     
     # Find event links
     links = []
+    seen_links = set()
     for a in soup.find_all("a", href=True):
         if "/new-events/" in a["href"]:
             url = urljoin("https://www.thevodojo.com", a["href"])
-            if url not in links:
+            if url not in seen_links:
+                seen_links.add(url)
                 links.append(url)
     
     log(f"Found {len(links)} event links")
     
-    for url in links[:30]:
+    pages = links[:source_config("thevodojo").get("max_event_pages", 30)]
+    for url, html in zip(pages, fetch_many(pages)):
         try:
-            html = fetch(url)
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             text = soup.get_text()
             
             # Get title
@@ -1188,7 +1388,7 @@ def scrape_vodojo():
                 title = slug.replace("-", " ").title()
             
             # Find date
-            date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}', text)
+            date_match = FULL_DATE_RE.search(text)
             if not date_match:
                 continue
             
@@ -1223,12 +1423,60 @@ def scrape_vodojo():
             log(f"⚠️  Error on {url}: {e}")
             continue
     
-    print(f"[VO DOJO] Found {len(events)} events")
+    say(f"[VO DOJO] Found {len(events)} events")
     return events
 
 # ============================================================================
 # MAIN
 # ============================================================================
+def loads_json(raw):
+    """Decode JSON text/bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_resources(data):
+    """Serialize resources JSON as UTF-8 bytes (2-space indent, trailing newline)."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_resources(path, data, existing=None):
+    """Atomically write resources JSON; returns False when the file is unchanged."""
+    payload = dumps_resources(data)
+
+    # Callers that already read the file pass its bytes in to skip a second read
+    if existing is None:
+        try:
+            with open(path, "rb") as f:
+                existing = f.read()
+        except OSError:
+            pass
+    if existing == payload:
+        return False
+
+    # Write next to the target and rename so a failed run never leaves a partial file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return True
+
+
+def run_scraper(scraper):
+    """Run one scraper in a worker thread, returning (events, buffered output lines, error)."""
+    _output.lines = []
+    try:
+        return scraper(), _output.lines, None
+    except Exception as e:
+        # Hand the error back with the buffer so main() prints it in order before raising
+        return None, _output.lines, e
+    finally:
+        _output.lines = None
+
+
 def main():
     print("\n" + "="*70)
     print("IMPROVED WORKSHOP SCRAPER")
@@ -1236,21 +1484,38 @@ def main():
     
     all_events = []
     
-    # Test scrapers individually
-    print("\n--- Testing improved scrapers ---\n")
-    
-    all_events.extend(scrape_van())
-    all_events.extend(scrape_voicetrax())
-    all_events.extend(scrape_soundon())
-    all_events.extend(scrape_halp())
-    all_events.extend(scrape_aiva())
+    scrapers = [
+        # Improved scrapers
+        scrape_van,
+        scrape_voicetrax,
+        scrape_soundon,
+        scrape_halp,
+        scrape_aiva,
+        # Working scrapers from original
+        scrape_vopros,
+        scrape_realvoice,
+        scrape_redscythe,
+        scrape_vodojo,
+    ]
     
-    # Use working ones from original
-    print("\n--- Using working scrapers from original ---\n")
-    all_events.extend(scrape_vopros())
-    all_events.extend(scrape_realvoice())
-    all_events.extend(scrape_redscythe())
-    all_events.extend(scrape_vodojo())
+    # Sources are independent and network-bound, so scrape them concurrently;
+    # the pooled connections are released once every scraper has finished
+    print("\n--- Running scrapers ---\n")
+    with closing(SESSION), ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+        futures = [pool.submit(run_scraper, scraper) for scraper in scrapers]
+        # Collect in submission order so dedup, output and logs match a serial run
+        error = None
+        for future in futures:
+            events, lines, exc = future.result()
+            for line in lines:
+                print(line)
+            if exc is not None:
+                error = error or exc
+                continue
+            all_events.extend(events)
+    # Re-raise the first scraper failure only once every scraper's output is shown
+    if error is not None:
+        raise error
     
     # Dedup by event ID (not URL - some sources share URLs)
     seen_ids = set()
@@ -1262,32 +1527,33 @@ def main():
         seen_ids.add(event_id)
         deduped.append(event)
     
-    now = datetime.now(datetz.gettz(DEFAULT_TZ))
-    future = []
-    for event in deduped:
-        start = datetime.fromisoformat(event["startAt"])
-        if start > (now - timedelta(days=7)):
-            future.append(event)
+    # Keep anything that started within the last week; cutoff computed once
+    cutoff = datetime.now(DEFAULT_TZINFO) - PAST_EVENT_GRACE
+    future = [event for event in deduped if datetime.fromisoformat(event["startAt"]) > cutoff]
     
     print(f"\n" + "="*70)
     print(f"TOTAL: {len(future)} workshops")
     print("="*70)
     
-    # Save
+    # Save; the bytes read here are also what write_resources compares against
+    existing = None
     try:
-        with open("resources.json", "r") as f:
-            data = json.load(f)
+        with open("resources.json", "rb") as f:
+            existing = f.read()
+        data = loads_json(existing)
     except:
         data = {"version": 2, "workshops": [], "announcements": [], "sponsors": [], "sections": []}
     
+    # Only bump lastUpdated when the workshops actually changed, so a no-op
+    # run serializes to the same bytes and write_resources can skip the write
+    if data.get("workshops") != future or "lastUpdated" not in data:
+        data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
     data["workshops"] = future
-    data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
-    
-    with open("resources.json", "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
     
-    print(f"\n✅ Saved to resources.json")
+    if write_resources("resources.json", data, existing):
+        print(f"\n✅ Saved to resources.json")
+    else:
+        print(f"\n✅ resources.json unchanged")
     
     # Show breakdown
     print("\nBy source:")